@@ -5,10 +5,16 @@ from streamlit_layout.main_view import display_main_view
 from streamlit_layout.side_bar import display_configuration__sidebar
 
 
+@st.cache_resource
+def get_default_config() -> EnigmaMachineConfig:
+    # Shared across reruns and sessions; machines only read their config
+    return EnigmaMachineConfig()
+
+
 def initialize_session_state():
     # Initialize enigma_machine in session state
     if "enigma_machine" not in st.session_state:
-        enigma_config = EnigmaMachineConfig()
+        enigma_config = get_default_config()
         st.session_state.enigma_machine = EnigmaMachine(enigma_config)
         st.session_state.rotor_miss = False
         st.session_state.show_slider = True
@@ -1,7 +1,75 @@
 from .plugboard import Plugboard
 from .reflector import Reflector
 from .rotor import Rotor
-from dataclasses import dataclass, field
+from . import enigma_kernel
+import string
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import getitem, itemgetter
+
+
+# The two slower working rotors have 26^2 distinct positions.
+LUT_CACHE_SIZE = 26**2
+
+# Translation tables between letters (A-Z) and their indices (0-25).
+_LETTER_TO_INDEX = bytes.maketrans(
+    string.ascii_uppercase.encode("ascii"), bytes(range(26))
+)
+_INDEX_TO_LETTER = bytes.maketrans(
+    bytes(range(26)), string.ascii_uppercase.encode("ascii")
+)
+
+
+def _translation_table(mapping: bytes | bytearray) -> bytes:
+    """
+    Extends a 26-entry mapping of letter indices to a table for bytes.translate.
+
+    Args:
+        mapping (bytes | bytearray): The output index of each input index (0-25).
+
+    Returns:
+        bytes: A 256-byte table applying the mapping to indices 0-25.
+    """
+    return bytes(mapping) + bytes(range(26, 256))
+
+
+@lru_cache(maxsize=32)
+def _translation_tables(mappings: tuple[bytes, ...]) -> tuple[bytes, ...]:
+    """
+    Extends the per-position mappings of a rotor to tables for bytes.translate.
+
+    Rotors with the same wiring share their mappings, so machines built from
+    the same rotors reuse the tables.
+
+    Args:
+        mappings (tuple[bytes, ...]): The mapping of each rotor position.
+
+    Returns:
+        tuple[bytes, ...]: The translation table of each rotor position.
+    """
+    return tuple(map(_translation_table, mappings))
+
+
+def _message_to_indices(message: str) -> bytes:
+    """
+    Converts a message to the indices of its letters.
+
+    Args:
+        message (str): The message to convert (a-z and A-Z).
+
+    Returns:
+        bytes: The index of each letter (0-25, where 0=A, 1=B, ..., 25=Z).
+
+    Raises:
+        ValueError: If the message contains non-alphabetic characters.
+    """
+    if message and not (message.isascii() and message.isalpha()):
+        letter = next(c for c in message if not (c.isascii() and c.isalpha()))
+        raise ValueError(
+            f"Input must be alphabetic characters (a-z and A-Z), found ' {letter} '"
+        )
+    return message.upper().encode("ascii").translate(_LETTER_TO_INDEX)
 
 
 class ActuatorBar:
@@ -13,6 +81,30 @@ class ActuatorBar:
     and rotates them accordingly.
     """
 
+    @staticmethod
+    def step(
+        positions: tuple[int, int, int], notches: tuple[int, int, int]
+    ) -> tuple[int, int, int]:
+        """
+        Computes the rotor positions after one push of the actuator bar.
+
+        Rotor0 always rotates. Rotor1 rotates once for rotor0 being at its
+        notch and once for itself being at its notch, in which case rotor2
+        rotates as well.
+
+        Args:
+            positions (tuple[int, int, int]): Current positions of the rotors.
+            notches (tuple[int, int, int]): Notch positions of the rotors.
+
+        Returns:
+            tuple[int, int, int]: The positions of the rotors after the push.
+        """
+        p0, p1, p2 = positions
+        # Booleans add as 0 or 1, so the positions are updated without branching.
+        at_notch0 = p0 == notches[0]
+        at_notch1 = p1 == notches[1]
+        return (p0 + 1) % 26, (p1 + at_notch0 + at_notch1) % 26, (p2 + at_notch1) % 26
+
     @staticmethod
     def push_rotors(rotors: list[Rotor]) -> None:
         """
@@ -21,20 +113,19 @@ class ActuatorBar:
         Args:
             rotors (list[Rotor]): List of rotor objects to push.
         """
-        r0, r1, r2 = rotors
-        if r1.is_at_notch():
-            r1.rotate()
-            r2.rotate()
-        if r0.is_at_notch():
-            r1.rotate()
-        r0.rotate()
+        positions = ActuatorBar.step(
+            tuple(rotor.get_current_position() for rotor in rotors),
+            tuple(rotor.notch for rotor in rotors),
+        )
+        for rotor, position in zip(rotors, positions):
+            rotor.set_position(position)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EnigmaMachineConfig:
     rotors_config_path: str = r"src/configs/default_rotor_configs.json"
-    working_rotor_indices: list[int] = field(default_factory=lambda: [0, 1, 2])
-    rotors_init_position: list[int] = field(default_factory=lambda: [0, 0, 0])
+    working_rotor_indices: tuple[int, ...] = (0, 1, 2)
+    rotors_init_position: tuple[int, ...] = (0, 0, 0)
     reflector_config_path: str = r"src/configs/default_reflector_config.json"
     plugboard_connections: str = "AJ KU DO WE FC NB QZ GM XV RT"
 
@@ -70,7 +161,7 @@ class EnigmaMachine:
         self.working_rotor_indices = self.config.working_rotor_indices
         # Initialize working rotors and set their initial positions
         self.working_rotors = [
-            self.rotors[i].set_position(pos)
+            self.rotors[i].set_position(pos % 26)
             for i, pos in zip(
                 self.working_rotor_indices, self.config.rotors_init_position
             )
@@ -82,19 +173,90 @@ class EnigmaMachine:
         )
         self.actuator_bar = ActuatorBar()
 
+        # Composed substitution tables of the whole circuit. For working rotor
+        # positions (p0, p1, p2), row p1 + 26 * p2 holds the tables for
+        # p0 = 0..25, repeated twice so that runs of p0 can be sliced without
+        # wrapping around. Both caches are reset whenever the circuit changes.
+        self._lut_cache: list[tuple[bytes, ...] | None] = []
+        # Circuit packed for the compiled kernel.
+        self._packed_circuit: tuple | None = None
+
+        self._update_rotor_stages()
         self.update_circuit()
 
+    def _update_rotor_stages(self) -> None:
+        """
+        Builds the translation tables of the working rotors and the reflector,
+        which only change with the rotor selection.
+        """
+        r0, r1, r2 = self.working_rotors
+        self._forward_stages = (
+            _translation_tables(r0.forward_table),
+            _translation_tables(r1.forward_table),
+            _translation_tables(r2.forward_table),
+        )
+        self._reflector_stage = _translation_table(self.reflector.mapping)
+        self._backward_stages = (
+            _translation_tables(r2.backward_table),
+            _translation_tables(r1.backward_table),
+            _translation_tables(r0.backward_table),
+        )
+
     def update_circuit(self):
         """
         Updates the Enigma machine's circuit configuration based on current settings.
+
+        The circuit is specialized for the current rotor selection and plugboard:
+        each stage is stored as translation tables, one per position for the
+        rotors, so that composing it only takes one bytes.translate per stage.
+        The plugboard is fused with rotor0 on the way in and on the way out.
         """
-        self.circuit = [
-            self.plugboard,
-            *self.working_rotors,
-            self.reflector,
-            *[rotor.backward for rotor in reversed(self.working_rotors)],
-            self.plugboard,
-        ]
+        plugboard = _translation_table(self.plugboard.mapping)
+        r0, r1, r2 = self._forward_stages
+        r2b, r1b, r0b = self._backward_stages
+        self.circuit = (
+            tuple(plugboard[:26].translate(table) for table in r0),
+            r1,
+            r2,
+            self._reflector_stage,
+            r2b,
+            r1b,
+            tuple(
+                _translation_table(table[:26].translate(plugboard)) for table in r0b
+            ),
+        )
+        self._lut_cache = [None] * LUT_CACHE_SIZE
+        self._packed_circuit = None
+
+    def _compose_row(self, p1: int, p2: int) -> tuple[bytes, ...]:
+        """
+        Composes and caches the circuit for all positions of rotor0.
+
+        The stages between rotor0 and its inverse are composed once, so each
+        position of rotor0 only adds its inbound and outbound stage.
+
+        Args:
+            p1 (int): Position of rotor1.
+            p2 (int): Position of rotor2.
+
+        Returns:
+            tuple[bytes, ...]: The composed tables, each mapping an input index
+                (0-25) to the output index of the circuit, for rotor0 at
+                positions 0 to 25, repeated twice.
+        """
+        inbound, r1, r2, ref, r2b, r1b, outbound = self.circuit
+        inner = _translation_table(
+            r1[p1][:26]
+            .translate(r2[p2])
+            .translate(ref)
+            .translate(r2b[p2])
+            .translate(r1b[p1])
+        )
+        row = tuple(
+            inbound[p0].translate(inner).translate(outbound[p0]) for p0 in range(26)
+        )
+        row = self._lut_cache[p1 + 26 * p2] = row + row
+        return row
 
     def encrypt_decrypt(self, message: str) -> str:
         """
@@ -103,20 +265,89 @@ class EnigmaMachine:
         Args:
             message (str): The message to encrypt or decrypt.
 
+        Returns:
+            str: The encrypted or decrypted message.
+
+        Raises:
+            ValueError: If the message contains non-alphabetic characters.
+        """
+        indices = _message_to_indices(message)
+        if enigma_kernel.encrypt_kernel is not None:
+            return self._encrypt_decrypt_compiled(indices)
+
+        # Plain positions are stepped and only written back to the rotors
+        # at the end, with everything used in the loop bound to locals.
+        lut_cache = self._lut_cache
+        compose_row = self._compose_row
+        step = self.actuator_bar.step
+        p0, p1, p2 = self.get_working_rotors_position()
+        notches = tuple(rotor.notch for rotor in self.working_rotors)
+        n0, n1, _ = notches
+
+        size = len(indices)
+        ciphertext = bytearray(size)
+        i = 0
+        while i < size:
+            # Following ActuatorBar.step, only rotor0 moves until it leaves its
+            # notch, unless rotor1 is at its own notch. The letters of such a
+            # run share a row of tables and are substituted in one C-level map.
+            if p1 != n1:
+                length = min((n0 - p0) % 26, size - i)
+                if length:
+                    row = lut_cache[p1 + 26 * p2] or compose_row(p1, p2)
+                    ciphertext[i : i + length] = bytes(
+                        map(
+                            getitem,
+                            row[p0 + 1 : p0 + 1 + length],
+                            indices[i : i + length],
+                        )
+                    )
+                    p0 = (p0 + length) % 26
+                    i += length
+                    if i == size:
+                        break
+
+            p0, p1, p2 = step((p0, p1, p2), notches)
+            row = lut_cache[p1 + 26 * p2] or compose_row(p1, p2)
+            ciphertext[i] = row[p0][indices[i]]
+            i += 1
+        self._set_working_rotors_position((p0, p1, p2))
+
+        return ciphertext.translate(_INDEX_TO_LETTER).decode("ascii")
+
+    def _encrypt_decrypt_compiled(self, indices: bytes) -> str:
+        """
+        Encrypts or decrypts letter indices with the compiled kernel.
+
+        Args:
+            indices (bytes): Indices of the message letters (0-25).
+
         Returns:
             str: The encrypted or decrypted message.
         """
-        ciphertext = ""
-        for letter in message:
-            self.actuator_bar.push_rotors(self.working_rotors)
-            current_letter = letter
+        ciphertext, positions = enigma_kernel.encrypt(
+            indices,
+            self._get_packed_circuit(),
+            self.get_working_rotors_position(),
+            [rotor.notch for rotor in self.working_rotors],
+        )
+        self._set_working_rotors_position(positions)
 
-            for component in self.circuit:
-                current_letter = component(current_letter)
+        return ciphertext.translate(_INDEX_TO_LETTER).decode("ascii")
 
-            ciphertext += chr(ord("A") + current_letter)
+    def _get_packed_circuit(self) -> tuple:
+        """
+        Retrieves the circuit packed for the compiled kernel,
+        packing it on first use.
 
-        return ciphertext
+        Returns:
+            tuple: The circuit packed by enigma_kernel.pack_circuit.
+        """
+        if self._packed_circuit is None:
+            self._packed_circuit = enigma_kernel.pack_circuit(
+                self.working_rotors, self.reflector, self.plugboard
+            )
+        return self._packed_circuit
 
     def __call__(self, message: str) -> str:
         """
@@ -126,6 +357,61 @@ class EnigmaMachine:
         """
         return self.encrypt_decrypt(message)
 
+    @classmethod
+    def crack(
+        cls,
+        ciphertext: str,
+        candidate_configs: list[EnigmaMachineConfig],
+        score_fn: Callable[[str], float],
+    ) -> list[tuple[float, EnigmaMachineConfig]]:
+        """
+        Decrypts a ciphertext under many candidate configurations and
+        ranks them by the score of the resulting plaintext.
+
+        When Numba is installed, all candidates are decrypted in parallel
+        by the compiled kernel.
+
+        Args:
+            ciphertext (str): The message to decrypt.
+            candidate_configs (list[EnigmaMachineConfig]): The configurations
+                to try.
+            score_fn (Callable[[str], float]): Scores a candidate plaintext,
+                higher meaning more likely to be correct.
+
+        Returns:
+            list[tuple[float, EnigmaMachineConfig]]: The score of each
+                candidate configuration, best first.
+
+        Raises:
+            ValueError: If the ciphertext contains non-alphabetic characters.
+        """
+        indices = _message_to_indices(ciphertext)
+        machines = [cls(config) for config in candidate_configs]
+
+        if enigma_kernel.encrypt_batch_kernel is not None and machines:
+            outputs = enigma_kernel.encrypt_batch(
+                indices,
+                [machine._get_packed_circuit() for machine in machines],
+                [machine.get_working_rotors_position() for machine in machines],
+                [
+                    [rotor.notch for rotor in machine.working_rotors]
+                    for machine in machines
+                ],
+            )
+            plaintexts = [
+                output.translate(_INDEX_TO_LETTER).decode("ascii")
+                for output in outputs
+            ]
+        else:
+            plaintexts = [machine.encrypt_decrypt(ciphertext) for machine in machines]
+
+        scores = [
+            (score_fn(plaintext), config)
+            for plaintext, config in zip(plaintexts, candidate_configs)
+        ]
+        scores.sort(key=itemgetter(0), reverse=True)
+        return scores
+
     def choose_rotors(
         self,
         target_rotor_indices: list[int],
@@ -144,9 +430,11 @@ class EnigmaMachine:
         if init_positions is None:
             init_positions = [0, 0, 0]
         self.working_rotors = [
-            self.rotors[i].set_position(pos)
+            self.rotors[i].set_position(pos % 26)
             for i, pos in zip(target_rotor_indices, init_positions)
         ]
+        self._update_rotor_stages()
+        self.update_circuit()
 
     def set_rotors_position(self, working_rotor_position: int, rotor_position: int):
         """
@@ -159,6 +447,22 @@ class EnigmaMachine:
         """
         self.working_rotors[working_rotor_position].set_position(rotor_position % 26)
 
+    def reset(self, positions: list[int] | None = None) -> None:
+        """
+        Rewinds the working rotors without rebuilding the circuit.
+
+        The composed tables only depend on the rotor selection and the
+        plugboard, so they stay cached across resets.
+
+        Args:
+            positions (list[int], optional): The positions of the working rotors.
+                If not provided, the initial positions of the machine's config
+                are used.
+        """
+        if positions is None:
+            positions = self.config.rotors_init_position
+        self._set_working_rotors_position([position % 26 for position in positions])
+
     def set_plugboard(self, connections: str | None = None) -> None:
         """
         Sets the plugboard connections for the Enigma machine.
@@ -169,7 +473,11 @@ class EnigmaMachine:
             connections (str, optional): A string representing plugboard
                 connections as letter pairs.
         """
-        self.plugboard.set_plugboard(connections)
+        try:
+            self.plugboard.set_plugboard(connections)
+        finally:
+            # The mapping is reset even if the new connections are invalid.
+            self.update_circuit()
 
     def get_working_rotors_position(self) -> list[int]:
         """
@@ -180,6 +488,16 @@ class EnigmaMachine:
         """
         return [rotor.get_current_position() for rotor in self.working_rotors]
 
+    def _set_working_rotors_position(self, positions: list[int]) -> None:
+        """
+        Sets the positions of all working rotors.
+
+        Args:
+            positions (list[int]): The new position of each working rotor.
+        """
+        for rotor, position in zip(self.working_rotors, positions):
+            rotor.set_position(position)
+
     def get_working_rotors_info(self) -> str:
         """
         Retrieves information about the current working rotors.
@@ -0,0 +1,192 @@
+"""
+Compiled kernel of the Enigma machine circuit.
+
+The kernel is only available when Numba is installed. Otherwise
+`encrypt_kernel` is None and EnigmaMachine falls back to its pure
+Python implementation.
+"""
+
+from __future__ import annotations
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _encrypt(
+    message, forward_tables, backward_tables, reflector, plugboard, positions, notches
+):
+    """
+    Encrypts or decrypts a message given as letter indices.
+
+    Args:
+        message (np.ndarray): uint8 indices of the message letters (0-25).
+        forward_tables (np.ndarray): (3, 26, 26) forward mappings of the working
+            rotors, indexed by rotor, position and input.
+        backward_tables (np.ndarray): (3, 26, 26) backward mappings of the
+            working rotors, indexed by rotor, position and input.
+        reflector (np.ndarray): 26-entry mapping of the reflector.
+        plugboard (np.ndarray): 26-entry mapping of the plugboard.
+        positions (np.ndarray): Positions of the working rotors, updated in place.
+        notches (np.ndarray): Notch positions of the working rotors.
+
+    Returns:
+        np.ndarray: uint8 indices of the output letters (0-25).
+    """
+    out = np.empty(message.shape[0], dtype=np.uint8)
+    for k in range(message.shape[0]):
+        # Same stepping as ActuatorBar.step. A position grows by at most 2,
+        # so wrapping it needs a compare and subtract rather than a division.
+        at_notch0 = positions[0] == notches[0]
+        at_notch1 = positions[1] == notches[1]
+        p0 = positions[0] + 1
+        p1 = positions[1] + at_notch0 + at_notch1
+        p2 = positions[2] + at_notch1
+        positions[0] = p0 - 26 if p0 >= 26 else p0
+        positions[1] = p1 - 26 if p1 >= 26 else p1
+        positions[2] = p2 - 26 if p2 >= 26 else p2
+
+        c = plugboard[message[k]]
+        for r in range(3):
+            c = forward_tables[r, positions[r], c]
+        c = reflector[c]
+        for r in range(2, -1, -1):
+            c = backward_tables[r, positions[r], c]
+        out[k] = plugboard[c]
+    return out
+
+
+# The kernel only touches its own arrays, so it can release the GIL and let
+# other threads (e.g. other Streamlit sessions) run while it encrypts.
+encrypt_kernel = None if njit is None else njit(cache=True, nogil=True)(_encrypt)
+
+
+def _encrypt_batch(
+    message, forward_tables, backward_tables, reflectors, plugboards, positions, notches
+):
+    """
+    Encrypts or decrypts a message under many configurations in parallel.
+
+    Args:
+        message (np.ndarray): uint8 indices of the message letters (0-25).
+        forward_tables (np.ndarray): (K, 3, 26, 26) forward tables of the rotors.
+        backward_tables (np.ndarray): (K, 3, 26, 26) backward tables of the rotors.
+        reflectors (np.ndarray): (K, 26) mappings of the reflectors.
+        plugboards (np.ndarray): (K, 26) mappings of the plugboards.
+        positions (np.ndarray): (K, 3) initial positions of the rotors,
+            updated in place.
+        notches (np.ndarray): (K, 3) notch positions of the rotors.
+
+    Returns:
+        np.ndarray: (K, N) uint8 indices of the output letters (0-25).
+    """
+    out = np.empty((positions.shape[0], message.shape[0]), dtype=np.uint8)
+    for k in prange(positions.shape[0]):
+        out[k] = encrypt_kernel(
+            message,
+            forward_tables[k],
+            backward_tables[k],
+            reflectors[k],
+            plugboards[k],
+            positions[k],
+            notches[k],
+        )
+    return out
+
+
+encrypt_batch_kernel = (
+    None if njit is None else njit(cache=True, parallel=True)(_encrypt_batch)
+)
+
+
+def pack_circuit(rotors, reflector, plugboard) -> tuple:
+    """
+    Packs the wiring of the circuit into arrays for `encrypt`.
+
+    Args:
+        rotors (list[Rotor]): The working rotors.
+        reflector (Reflector): The reflector.
+        plugboard (Plugboard): The plugboard.
+
+    Returns:
+        tuple: The forward and backward tables of the rotors, the reflector
+            and the plugboard mappings as uint8 arrays.
+    """
+    forward_tables = b"".join(b"".join(rotor.forward_table) for rotor in rotors)
+    backward_tables = b"".join(b"".join(rotor.backward_table) for rotor in rotors)
+    return (
+        np.frombuffer(forward_tables, dtype=np.uint8).reshape(3, 26, 26),
+        np.frombuffer(backward_tables, dtype=np.uint8).reshape(3, 26, 26),
+        np.frombuffer(reflector.mapping, dtype=np.uint8),
+        np.frombuffer(plugboard.mapping, dtype=np.uint8),
+    )
+
+
+def encrypt(
+    message: bytes, packed_circuit: tuple, positions: list[int], notches: list[int]
+) -> tuple[bytes, list[int]]:
+    """
+    Runs the compiled kernel on a message.
+
+    Args:
+        message (bytes): Indices of the message letters (0-25).
+        packed_circuit (tuple): The circuit packed by `pack_circuit`.
+        positions (list[int]): Positions of the working rotors.
+        notches (list[int]): Notch positions of the working rotors.
+
+    Returns:
+        tuple[bytes, list[int]]: Indices of the output letters (0-25)
+            and the positions of the working rotors afterwards.
+    """
+    # The kernel indexes its tables by position without bounds checks and only
+    # wraps positions it steps, so they are wrapped into 0-25 here.
+    rotor_positions = np.array(positions, dtype=np.int64) % 26
+    out = encrypt_kernel(
+        np.frombuffer(message, dtype=np.uint8),
+        *packed_circuit,
+        rotor_positions,
+        np.array(notches, dtype=np.int64),
+    )
+    return out.tobytes(), rotor_positions.tolist()
+
+
+def encrypt_batch(
+    message: bytes,
+    packed_circuits: list[tuple],
+    positions: list[list[int]],
+    notches: list[list[int]],
+) -> list[bytes]:
+    """
+    Runs the compiled kernel on a message under many configurations.
+
+    Args:
+        message (bytes): Indices of the message letters (0-25).
+        packed_circuits (list[tuple]): Circuits packed by `pack_circuit`.
+        positions (list[list[int]]): Initial positions of the working rotors
+            of each circuit.
+        notches (list[list[int]]): Notch positions of the working rotors
+            of each circuit.
+
+    Returns:
+        list[bytes]: Indices of the output letters (0-25) for each circuit.
+    """
+    forward_tables, backward_tables, reflectors, plugboards = (
+        np.stack(arrays) for arrays in zip(*packed_circuits)
+    )
+    out = encrypt_batch_kernel(
+        np.frombuffer(message, dtype=np.uint8),
+        forward_tables,
+        backward_tables,
+        reflectors,
+        plugboards,
+        np.array(positions, dtype=np.int64) % 26,
+        np.array(notches, dtype=np.int64),
+    )
+    return [row.tobytes() for row in out]
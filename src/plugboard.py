@@ -1,4 +1,8 @@
 from __future__ import annotations
+import string
+
+_LETTERS = string.ascii_uppercase.encode("ascii")
+_A = ord("A")
 
 
 class Plugboard:
@@ -9,6 +13,8 @@ class Plugboard:
     before and after the rotor.
     """
 
+    __slots__ = ("mapping", "_connections", "_translation")
+
     def __init__(self, connections: str) -> None:
         """
         Initialize the plugboard with given connections.
@@ -58,37 +64,39 @@ class Plugboard:
         if len(connection_pairs) > 10:
             raise ValueError("Only up to 10 connections are supported.")
 
+        mapping = bytearray(self.mapping)
+        # Bit i is set once letter i is connected.
+        used = 0
         for pair in connection_pairs:
             if len(pair) != 2:
                 raise ValueError(f"Invalid connection pair: {pair}")
 
-            char1, char2 = pair
-            index1 = ord(char1.upper()) - ord("A")
-            index2 = ord(char2.upper()) - ord("A")
-
-            if index1 == index2:
-                raise ValueError(f"Invalid connection pair: {pair}")
+            # Non-ASCII characters become "?", which is rejected as invalid below.
+            code1, code2 = pair.encode("ascii", "replace").upper()
+            index1 = code1 - _A
+            index2 = code2 - _A
 
             if not (0 <= index1 < 26 and 0 <= index2 < 26):
                 raise ValueError(f"Invalid characters in pair: {pair}")
 
-            if self.mapping[index1] != index1 or self.mapping[index2] != index2:
+            if index1 == index2:
+                raise ValueError(f"Invalid connection pair: {pair}")
+
+            bits = (1 << index1) | (1 << index2)
+            if used & bits:
                 duplicates = [pair]
-                if self.mapping[index1] != index1:
-                    duplicates.append(
-                        chr(ord("A") + index1) + chr(ord("A") + self.mapping[index1])
-                    )
-                if self.mapping[index2] != index2:
-                    duplicates.append(
-                        chr(ord("A") + index2) + chr(ord("A") + self.mapping[index2])
-                    )
+                for index in (index1, index2):
+                    if used & (1 << index):
+                        duplicates.append(chr(_A + index) + chr(_A + mapping[index]))
                 raise ValueError(
                     f"Repeated character in connections: {', '.join(duplicates)}"
                 )
 
-            self.mapping[index1] = index2
-            self.mapping[index2] = index1
+            used |= bits
+            mapping[index1], mapping[index2] = index2, index1
 
+        self.mapping = bytes(mapping)
+        self._translation = bytes.maketrans(_LETTERS, bytes(_A + c for c in mapping))
         return self
 
     def pass_through(self, input: int | str) -> int:
@@ -107,17 +115,74 @@ class Plugboard:
                 or a single alphabetic character (A-Z).
         """
         if isinstance(input, str):
-            if not input.isalpha():
-                raise ValueError(
-                    f"Input must be alphabetic characters (a-z and A-Z), found ' {input} '"
-                )
-            input = ord(input.upper()) - ord("A")
+            return self.pass_through_str(input)
+
+        if input < 0 or input > 25:
+            raise ValueError("Input integer must be between 0 and 25 (inclusive)")
+
+        return self.pass_through_int(input)
+
+    def pass_through_int(self, input: int) -> int:
+        """
+        Pass a character index through the plugboard without validation.
+
+        Args:
+            input (int): The index of the input character (0-25).
+
+        Returns:
+            int: The index of the output character after passing through the plugboard.
+        """
+        return self.mapping[input]
+
+    def pass_through_str(self, input: str) -> int:
+        """
+        Pass a single character through the plugboard.
+
+        Args:
+            input (str): A single character (A-Z).
+
+        Returns:
+            int: The index of the output character after passing through the plugboard.
+
+        Raises:
+            ValueError: If the input is not a single alphabetic character (A-Z).
+        """
+        if not input.isalpha():
+            raise ValueError(
+                f"Input must be alphabetic characters (a-z and A-Z), found ' {input} '"
+            )
+        input = ord(input.upper()) - _A
 
         if input < 0 or input > 25:
             raise ValueError("Input integer must be between 0 and 25 (inclusive)")
 
         return self.mapping[input]
 
+    def apply_many(self, inputs: bytes) -> bytes:
+        """
+        Pass many character indices through the plugboard without validation.
+
+        Args:
+            inputs (bytes): The indices of the input characters (0-25).
+
+        Returns:
+            bytes: The indices of the output characters.
+        """
+        return bytes(map(self.mapping.__getitem__, inputs))
+
+    def translate(self, data: bytes) -> bytes:
+        """
+        Pass a whole text through the plugboard.
+
+        Args:
+            data (bytes): ASCII text. Uppercase letters (A-Z) are swapped
+                according to the connections, other bytes are left unchanged.
+
+        Returns:
+            bytes: The text after passing through the plugboard.
+        """
+        return data.translate(self._translation)
+
     def __call__(self, input: int | str) -> int:
         """
         Make Plugboard callable.
@@ -128,7 +193,11 @@ class Plugboard:
 
     def reset_plugboard(self) -> Plugboard:
         """Reset the plugboard state to no connections."""
-        self.mapping = list(range(26))
+        self.mapping = bytes(range(26))
+        # Table for bytes.translate, swapping connected letters (A-Z).
+        self._translation = bytes.maketrans(_LETTERS, _LETTERS)
+        # Cached result of get_plugboard_connections.
+        self._connections: str | None = None
         return self
 
     def get_plugboard_connections(self) -> str:
@@ -139,11 +208,12 @@ class Plugboard:
             str: A string representing the current plugboard connections,
                  formatted as space-separated letter pairs.
         """
-        connections = []
-        temp = self.mapping.copy()
-        for i, c in enumerate(temp):
-            if i != c:
-                connections.append(chr(ord("A") + i) + chr(ord("A") + c))
-                temp[c] = c
-
-        return " ".join(connections)
+        if self._connections is None:
+            # Each pair is listed once, from its smaller letter.
+            self._connections = " ".join(
+                chr(_A + i) + chr(_A + c)
+                for i, c in enumerate(self.mapping)
+                if i < c
+            )
+
+        return self._connections
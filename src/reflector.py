@@ -2,10 +2,13 @@ from __future__ import annotations
 import json
 import random
 import string
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from .utils import load_json
 
+_A = ord("A")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ReflectorConfig:
     """
     Configuration for an Enigma machine reflector.
@@ -27,6 +30,8 @@ class Reflector:
     Enigma machine, sending it back through the rotors in the opposite direction.
     """
 
+    __slots__ = ("config", "wiring", "mapping")
+
     def __init__(self, config: ReflectorConfig) -> None:
         """
         Initialize a Reflector object.
@@ -41,11 +46,11 @@ class Reflector:
         """
         self.config = config
         self.wiring = config.wiring
-        self.mapping = [ord(c) - ord("A") for c in config.wiring]
-        if len(set(self.mapping)) != 26:
+        if sorted(config.wiring) != list(string.ascii_uppercase):
             raise ValueError(
                 "Wiring must be a 26-character string with unique letters A-Z."
             )
+        self.mapping = bytes(ord(c) - _A for c in config.wiring)
 
     def reflect(self, input: int) -> int:
         """
@@ -85,15 +90,13 @@ class Reflector:
         Generates a ReflectorConfig containing a random 26-character
         string for reflector wiring.
         """
-        alphabet = list(string.ascii_uppercase)
+        # Pair up consecutive letters of a random permutation.
+        alphabet = random.sample(string.ascii_uppercase, 26)
         wiring = [""] * 26
 
-        while alphabet:
-            a, b = random.sample(alphabet, 2)
-            alphabet.remove(a)
-            alphabet.remove(b)
-            wiring[ord(a) - ord("A")] = b
-            wiring[ord(b) - ord("A")] = a
+        for a, b in zip(alphabet[::2], alphabet[1::2]):
+            wiring[ord(a) - _A] = b
+            wiring[ord(b) - _A] = a
 
         return ReflectorConfig(wiring="".join(wiring))
 
@@ -102,8 +105,7 @@ class Reflector:
         """
         Load reflector configs from json file and return a Reflector objects.
         """
-        with open(filename, "r") as f:
-            data = json.load(f)
+        data = load_json(filename)
 
         return cls(ReflectorConfig(**data["reflectors"]))
 
@@ -111,7 +113,7 @@ class Reflector:
     def save_config(config: ReflectorConfig, filename: str):
         """Save a ReflectorConfig object to a json file."""
         if isinstance(config, ReflectorConfig):
-            data = {"reflectors": config.__dict__}
+            data = {"reflectors": asdict(config)}
             with open(filename, "w") as f:
                 json.dump(data, f, indent=4)
         else:
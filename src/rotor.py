@@ -2,10 +2,15 @@ from __future__ import annotations
 import json
 import random
 import string
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from .utils import load_json
 
+# Code point of the first letter, index 0.
+_A = ord("A")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RotorConfig:
     """
     Configuration for an Enigma machine rotor.
@@ -14,11 +19,46 @@ class RotorConfig:
         name (str): The name of the rotor.
         wiring (str): A 26-character string representing rotor wiring (A-Z).
         notch (int): Notch position (0-25, where 0=A, 1=B, ..., 25=Z).
+        forward_mapping (bytes): The wiring as letter indices, derived from
+            `wiring`.
+        backward_mapping (bytes): The inverse of `forward_mapping`.
     """
 
     name: str
     wiring: str
     notch: int
+    forward_mapping: bytes = field(init=False, repr=False, compare=False)
+    backward_mapping: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Computed once per config, so every Rotor built from it shares them.
+        forward_mapping = bytes(ord(c) - _A for c in self.wiring)
+        backward_mapping = bytearray(26)
+        for i, c in enumerate(forward_mapping):
+            backward_mapping[c] = i
+        object.__setattr__(self, "forward_mapping", forward_mapping)
+        object.__setattr__(self, "backward_mapping", bytes(backward_mapping))
+
+
+@lru_cache(maxsize=32)
+def _position_tables(mapping: bytes) -> tuple[bytes, ...]:
+    """
+    Applies the rotor offset to a mapping for every position.
+
+    table[position][input] == (mapping[(position + input) % 26] - position) % 26
+    Python's % is never negative for a positive modulus, so no +26 is needed,
+    and forward()/backward() do no arithmetic at all. The tables only depend on
+    the mapping, so rotors with the same wiring share them.
+
+    Args:
+        mapping (bytes): The wiring of the rotor as letter indices.
+
+    Returns:
+        tuple[bytes, ...]: The 26 offset mappings, indexed by position.
+    """
+    return tuple(
+        bytes((mapping[(p + i) % 26] - p) % 26 for i in range(26)) for p in range(26)
+    )
 
 
 class Rotor:
@@ -29,6 +69,18 @@ class Rotor:
     forming the core of Enigma's encryption mechanism.
     """
 
+    __slots__ = (
+        "_position",
+        "config",
+        "name",
+        "wiring",
+        "notch",
+        "forward_mapping",
+        "backward_mapping",
+        "forward_table",
+        "backward_table",
+    )
+
     def __init__(self, config: RotorConfig, init_position: int = 0) -> None:
         """
         Initializes the Rotor with the given configuration
@@ -44,12 +96,11 @@ class Rotor:
         self.wiring = config.wiring
         self.notch = config.notch
 
-        self.forward_mapping = [ord(c) - ord("A") for c in self.wiring]
-        self.backward_mapping = [0] * 26
-        for i, c in enumerate(self.wiring):
-            self.backward_mapping[ord(c) - ord("A")] = i
+        self.forward_mapping = config.forward_mapping
+        self.backward_mapping = config.backward_mapping
 
-        self.direction_methods = {"forward": self.forward, "backward": self.backward}
+        self.forward_table = _position_tables(self.forward_mapping)
+        self.backward_table = _position_tables(self.backward_mapping)
 
     def __repr__(self) -> str:
         """ ""
@@ -79,9 +130,7 @@ class Rotor:
             int: The index of the output character after passing
                 through the rotor in forward direction.
         """
-        index = (self._position + input) % 26
-        output = self.forward_mapping[index]
-        return (output - self._position + 26) % 26
+        return self.forward_table[self._position][input]
 
     def backward(self, input: int) -> int:
         """
@@ -96,9 +145,33 @@ class Rotor:
             int: The index of the output character after passing
                 through the rotor in the backward direction.
         """
-        index = (self._position + input) % 26
-        output = self.backward_mapping[index]
-        return (output - self._position + 26) % 26
+        return self.backward_table[self._position][input]
+
+    def forward_many(self, inputs: bytes) -> bytes:
+        """
+        Maps many character indices through the rotor's wiring in the
+        forward direction at the current position.
+
+        Args:
+            inputs (bytes): The indices of the input characters (0-25).
+
+        Returns:
+            bytes: The indices of the output characters.
+        """
+        return bytes(map(self.forward_table[self._position].__getitem__, inputs))
+
+    def backward_many(self, inputs: bytes) -> bytes:
+        """
+        Maps many character indices through the rotor's wiring in the
+        backward direction at the current position.
+
+        Args:
+            inputs (bytes): The indices of the input characters (0-25).
+
+        Returns:
+            bytes: The indices of the output characters.
+        """
+        return bytes(map(self.backward_table[self._position].__getitem__, inputs))
 
     def __call__(self, input: int) -> int:
         """
@@ -146,10 +219,8 @@ class Rotor:
     @staticmethod
     def generate_config(name: str) -> RotorConfig:
         """Generate a random rotor config."""
-        alphabet = list(string.ascii_uppercase)
-        random.shuffle(alphabet)
-        wiring = "".join(alphabet)
-        notch = random.randint(0, 25)
+        wiring = "".join(random.sample(string.ascii_uppercase, 26))
+        notch = random.randrange(26)
 
         return RotorConfig(name=name, wiring=wiring, notch=notch)
 
@@ -158,8 +229,7 @@ class Rotor:
         """
         Load rotor configs from json file and return a list of Rotor objects.
         """
-        with open(filename, "r") as f:
-            data = json.load(f)
+        data = load_json(filename)
         return [cls(RotorConfig(**rotor_data)) for rotor_data in data["rotors"]]
 
     @staticmethod
@@ -175,7 +245,12 @@ class Rotor:
                 "configs must be a RotorConfig object or a list of RotorConfig objects"
             )
 
-        data = {"rotors": [config.__dict__ for config in configs]}
+        data = {
+            "rotors": [
+                {f.name: getattr(config, f.name) for f in fields(config) if f.init}
+                for config in configs
+            ]
+        }
         with open(filename, "w") as f:
             json.dump(data, f, indent=4)
 
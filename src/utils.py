@@ -0,0 +1,20 @@
+from __future__ import annotations
+import functools
+import json
+import os
+
+
+@functools.lru_cache(maxsize=32)
+def _load_json(filename: str, mtime_ns: int) -> dict:
+    """Parse a json file. Cached per modification time of the file."""
+    with open(filename, "r") as f:
+        return json.load(f)
+
+
+def load_json(filename: str) -> dict:
+    """
+    Load a json file, reusing the parsed content until the file is modified.
+
+    The returned dict is shared between calls and must not be modified.
+    """
+    return _load_json(filename, os.stat(filename).st_mtime_ns)
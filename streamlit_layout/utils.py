@@ -3,6 +3,9 @@ import string
 from src.enigma import EnigmaMachine
 
 
+_ALPHABET = string.ascii_uppercase
+_A = ord("A")
+
 name_to_index = {
     "Rotor I": 0,
     "Rotor II": 1,
@@ -22,7 +25,7 @@ def update_rotor_position() -> None:
     ):
         st.session_state.enigma_machine.set_rotors_position(
             working_rotor_position,
-            ord(st.session_state[f"rotor{working_rotor_position}_position"]) - ord("A"),
+            ord(st.session_state[f"rotor{working_rotor_position}_position"]) - _A,
         )
 
 
@@ -30,17 +33,15 @@ def update_working_rotors() -> None:
     """
     Update the working rotors based on user selection.
     """
-    match len(st.session_state["working_rotor_names"]):
-        case 3:
-            working_rotor_indices = [
-                name_to_index[name] for name in st.session_state["working_rotor_names"]
-            ]
-            st.session_state.enigma_machine.choose_rotors(working_rotor_indices)
-            st.session_state.rotor_miss = False
-            st.session_state.show_slider = True
-        case _:
-            st.session_state.rotor_miss = True
-            st.session_state.show_slider = False
+    ss = st.session_state
+    names = ss["working_rotor_names"]
+    if len(names) == 3:
+        ss.enigma_machine.choose_rotors(list(map(name_to_index.__getitem__, names)))
+        ss.rotor_miss = False
+        ss.show_slider = True
+    else:
+        ss.rotor_miss = True
+        ss.show_slider = False
 
 
 def create_rotor_init_positon_slider(i: int) -> None:
@@ -55,7 +56,7 @@ def create_rotor_init_positon_slider(i: int) -> None:
         f"Init Position of {rotor.name} :gear:",
         options=string.ascii_uppercase,
         value=chr(
-            st.session_state.enigma_machine.config.rotors_init_position[i] + ord("A")
+            st.session_state.enigma_machine.config.rotors_init_position[i] + _A
         ),
         key=f"rotor{i}_position",
         # Updates the Enigma machine's rotor
@@ -89,10 +90,24 @@ def display_rotor_position(rotor_name: str, position: int, notch: int) -> None:
         notch (int): Notch position of the rotor.
     """
     st.write(f"{rotor_name}: ")
-    chars = list("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
-    chars[position] = f"[{chars[position]}]"
-    chars[notch] = f"*{chars[notch]}*"
-    st.code("".join(chars))
+    first, second = sorted((position, notch))
+    marked = _ALPHABET[:first] + _mark_letter(first, position, notch)
+    if second != first:
+        marked += _ALPHABET[first + 1 : second] + _mark_letter(second, position, notch)
+    st.code(marked + _ALPHABET[second + 1 :])
+
+
+def _mark_letter(index: int, position: int, notch: int) -> str:
+    """
+    Returns the letter at index, wrapped in [] if it is the rotor's
+    position and in ** if it is the rotor's notch.
+    """
+    letter = _ALPHABET[index]
+    if index == position:
+        letter = f"[{letter}]"
+    if index == notch:
+        letter = f"*{letter}*"
+    return letter
 
 
 def display_enigma_config(machine: EnigmaMachine):
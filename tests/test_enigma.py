@@ -9,47 +9,71 @@ class TestEnigmaMachine(unittest.TestCase):
 
     def test_encrypt_decrypt(self):
         """Test encryption and decryption"""
-        plaintext = "HELLO"
-        machine = EnigmaMachine(self.config)
-        encrypted = machine.encrypt_decrypt(plaintext)
-        machine = EnigmaMachine(self.config)
-        decrypted = machine.encrypt_decrypt(encrypted)
-        self.assertEqual(decrypted, plaintext)
+        cases = [
+            (self.config, "HELLO"),
+            (self.config, "HELLOAIOUJOIJQKJLKAJJKCJIAKIOIUQIJLKAJJIOAUSKLQJ"),
+            (
+                EnigmaMachineConfig(
+                    working_rotor_indices=[4, 2, 1], rotors_init_position=[23, 1, 15]
+                ),
+                "ASDKJWIOASJDLKJLKJKKKJASLKDJIWKASJD",
+            ),
+        ]
+        for config, plaintext in cases:
+            with self.subTest(plaintext=plaintext):
+                machine = EnigmaMachine(config)
+                encrypted = machine.encrypt_decrypt(plaintext)
+                self.assertEqual(
+                    EnigmaMachine(config).encrypt_decrypt(encrypted), plaintext
+                )
 
-        plaintext = "HELLOAIOUJOIJQKJLKAJJKCJIAKIOIUQIJLKAJJIOAUSKLQJ"
-        machine = EnigmaMachine(self.config)
-        encrypted = machine.encrypt_decrypt(plaintext)
+                self.assertNotEqual(machine.encrypt_decrypt(plaintext), encrypted)
+                self.assertNotEqual(machine.encrypt_decrypt(encrypted), plaintext)
+
+                machine.reset()
+                self.assertEqual(machine.encrypt_decrypt(encrypted), plaintext)
+
+    def test_composed_circuit(self):
+        """Test the composed circuit against passing through each component"""
         machine = EnigmaMachine(self.config)
-        decrypted = machine.encrypt_decrypt(encrypted)
-        self.assertEqual(decrypted, plaintext)
+        r0, r1, r2 = machine.working_rotors
+        pb, ref = machine.plugboard, machine.reflector
+        for positions in [(0, 0, 0), (5, 17, 25), (25, 3, 11)]:
+            composed = machine._compose_row(*positions[1:])[positions[0]]
+            for rotor, position in zip(machine.working_rotors, positions):
+                rotor.set_position(position)
+            for i in range(26):
+                c = r2(r1(r0(pb(i))))
+                c = r0.backward(r1.backward(r2.backward(ref(c))))
+                self.assertEqual(composed[i], pb(c))
 
-        config = EnigmaMachineConfig(
-            working_rotor_indices=[4, 2, 1], rotors_init_position=[23, 1, 15]
+    def test_derived_tables_shared(self):
+        """Test that machines with the same rotors share derived tables"""
+        machine1 = EnigmaMachine(self.config)
+        machine2 = EnigmaMachine(self.config)
+        self.assertIs(
+            machine1.working_rotors[0].forward_table,
+            machine2.working_rotors[0].forward_table,
         )
-        plaintext = "ASDKJWIOASJDLKJLKJKKKJASLKDJIWKASJD"
-        machine = EnigmaMachine(config)
-        encrypted = machine.encrypt_decrypt(plaintext)
-        machine = EnigmaMachine(config)
-        decrypted = machine.encrypt_decrypt(encrypted)
-        self.assertEqual(decrypted, plaintext)
+        self.assertIs(machine1._forward_stages[0], machine2._forward_stages[0])
+        with self.assertRaises(AttributeError):
+            self.config.plugboard_connections = "AB"
 
-        config = EnigmaMachineConfig(
-            working_rotor_indices=[4, 2, 1], rotors_init_position=[23, 1, 15]
-        )
-        plaintext = "ASDKJWIOASJDLKJLKJKKKJASLKDJIWKASJD"
-        machine = EnigmaMachine(config)
-        encrypted = machine.encrypt_decrypt(plaintext)
-        decrypted = machine.encrypt_decrypt(encrypted)
-        self.assertNotEqual(decrypted, plaintext)
+    def test_out_of_range_init_position(self):
+        """Test that initial positions wrap around like rotor positions"""
+        plaintext = "HELLOWORLD"
+        for positions, wrapped in [((0, 30, 0), (0, 4, 0)), ((0, 0, 40), (0, 0, 14))]:
+            with self.subTest(positions=positions):
+                expected = EnigmaMachine(
+                    EnigmaMachineConfig(rotors_init_position=wrapped)
+                ).encrypt_decrypt(plaintext)
+                machine = EnigmaMachine(
+                    EnigmaMachineConfig(rotors_init_position=positions)
+                )
+                self.assertEqual(machine.encrypt_decrypt(plaintext), expected)
 
-        config = EnigmaMachineConfig(
-            working_rotor_indices=[4, 2, 1], rotors_init_position=[23, 1, 15]
-        )
-        plaintext = "ASDKJWIOASJDLKJLKJKKKJASLKDJIWKASJD"
-        machine = EnigmaMachine(config)
-        encrypted1 = machine.encrypt_decrypt(plaintext)
-        encrypted2 = machine.encrypt_decrypt(plaintext)
-        self.assertNotEqual(encrypted1, encrypted2)
+                machine.choose_rotors([0, 1, 2], positions)
+                self.assertEqual(machine.encrypt_decrypt(plaintext), expected)
 
     def test_choose_rotors(self):
         """Test choosing rotors"""
@@ -70,6 +94,17 @@ class TestEnigmaMachine(unittest.TestCase):
         self.assertEqual(machine.working_rotors[2]._position, 23)
         # print(machine.get_working_rotors_info())
 
+    def test_reset(self):
+        """Test rewinding the rotors"""
+        machine = EnigmaMachine(self.config)
+        lut_cache = machine._lut_cache
+        machine.encrypt_decrypt("HELLOWORLD")
+        machine.reset()
+        self.assertEqual(machine.get_working_rotors_position(), [0, 0, 0])
+        machine.reset([3, 27, 25])
+        self.assertEqual(machine.get_working_rotors_position(), [3, 1, 25])
+        self.assertIs(machine._lut_cache, lut_cache)
+
     def test_set_plugboard(self):
         """Test setting plugboard connections"""
         machine = EnigmaMachine(self.config)
@@ -92,3 +127,50 @@ class TestEnigmaMachine(unittest.TestCase):
         machine.actuator_bar.push_rotors(rotors)
         positions = [r._position for r in rotors]
         self.assertEqual(positions, [rotors[0].notch + 1, 1, 0])
+
+    def test_choose_rotors_updates_circuit(self):
+        """Test that chosen rotors are used for encryption"""
+        plaintext = "ASDKJWIOASJDLKJLKJKKKJASLKDJIWKASJD"
+        config = EnigmaMachineConfig(
+            working_rotor_indices=[3, 4, 1], rotors_init_position=[2, 7, 11]
+        )
+        expected = EnigmaMachine(config).encrypt_decrypt(plaintext)
+
+        machine = EnigmaMachine(self.config)
+        machine.encrypt_decrypt(plaintext)
+        machine.choose_rotors([3, 4, 1], [2, 7, 11])
+        self.assertEqual(machine.encrypt_decrypt(plaintext), expected)
+
+    def test_set_plugboard_updates_circuit(self):
+        """Test that new plugboard connections are used for encryption"""
+        plaintext = "ASDKJWIOASJDLKJLKJKKKJASLKDJIWKASJD"
+        config = EnigmaMachineConfig(plugboard_connections="AB CD EF")
+        expected = EnigmaMachine(config).encrypt_decrypt(plaintext)
+
+        machine = EnigmaMachine(self.config)
+        machine.encrypt_decrypt(plaintext)
+        machine.set_plugboard("AB CD EF")
+        machine.choose_rotors([0, 1, 2])
+        self.assertEqual(machine.encrypt_decrypt(plaintext), expected)
+
+    def test_crack(self):
+        """Test ranking candidate configurations by their decryption"""
+        plaintext = "HELLOWORLDTHISISATESTMESSAGE"
+        config = EnigmaMachineConfig(
+            working_rotor_indices=[2, 0, 4], rotors_init_position=[3, 25, 8]
+        )
+        ciphertext = EnigmaMachine(config).encrypt_decrypt(plaintext)
+
+        candidates = [
+            EnigmaMachineConfig(
+                working_rotor_indices=[2, 0, 4], rotors_init_position=[p0, 25, 8]
+            )
+            for p0 in range(26)
+        ]
+        scores = EnigmaMachine.crack(
+            ciphertext,
+            candidates,
+            lambda text: sum(a == b for a, b in zip(text, plaintext)),
+        )
+        self.assertEqual(len(scores), 26)
+        self.assertEqual(scores[0], (len(plaintext), candidates[3]))
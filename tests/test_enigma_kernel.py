@@ -0,0 +1,93 @@
+import unittest
+from unittest import mock
+from src import enigma_kernel
+from src.enigma import EnigmaMachine, EnigmaMachineConfig
+
+
+@unittest.skipIf(enigma_kernel.np is None, "NumPy is not installed")
+class TestPackCircuit(unittest.TestCase):
+    def test_pack_circuit(self):
+        """Test that the packed circuit holds the tables of each component"""
+        machine = EnigmaMachine(EnigmaMachineConfig(working_rotor_indices=[4, 2, 1]))
+        rotors = machine.working_rotors
+        forward_tables, backward_tables, reflector, plugboard = (
+            enigma_kernel.pack_circuit(rotors, machine.reflector, machine.plugboard)
+        )
+
+        for array, shape in [
+            (forward_tables, (3, 26, 26)),
+            (backward_tables, (3, 26, 26)),
+            (reflector, (26,)),
+            (plugboard, (26,)),
+        ]:
+            self.assertEqual(array.shape, shape)
+            self.assertEqual(array.dtype, enigma_kernel.np.uint8)
+        for r, rotor in enumerate(rotors):
+            for position in range(26):
+                self.assertEqual(
+                    forward_tables[r, position].tobytes(), rotor.forward_table[position]
+                )
+                self.assertEqual(
+                    backward_tables[r, position].tobytes(),
+                    rotor.backward_table[position],
+                )
+        self.assertEqual(reflector.tobytes(), bytes(machine.reflector.mapping))
+        self.assertEqual(plugboard.tobytes(), machine.plugboard.mapping)
+
+
+@unittest.skipIf(enigma_kernel.encrypt_kernel is None, "Numba is not installed")
+class TestEnigmaKernel(unittest.TestCase):
+    def test_matches_python_implementation(self):
+        """Test that the compiled kernel matches the pure Python circuit"""
+        config = EnigmaMachineConfig(
+            working_rotor_indices=[4, 2, 1], rotors_init_position=[23, 1, 15]
+        )
+        plaintext = "ASDKJWIOASJDLKJLKJKKKJASLKDJIWKASJD" * 30
+
+        machine = EnigmaMachine(config)
+        encrypted = machine.encrypt_decrypt(plaintext)
+        positions = machine.get_working_rotors_position()
+
+        with mock.patch.object(enigma_kernel, "encrypt_kernel", None):
+            machine = EnigmaMachine(config)
+            self.assertEqual(machine.encrypt_decrypt(plaintext), encrypted)
+            self.assertEqual(machine.get_working_rotors_position(), positions)
+
+    def test_out_of_range_positions(self):
+        """Test that the kernel wraps positions outside 0-25"""
+        machine = EnigmaMachine(EnigmaMachineConfig())
+        packed_circuit = machine._get_packed_circuit()
+        notches = [rotor.notch for rotor in machine.working_rotors]
+        message = bytes(range(26)) * 3
+        self.assertEqual(
+            enigma_kernel.encrypt(message, packed_circuit, [0, 0, 40], notches),
+            enigma_kernel.encrypt(message, packed_circuit, [0, 0, 14], notches),
+        )
+        for positions, wrapped in [([0, 0, 40], [0, 0, 14]), ([26, 30, 0], [0, 4, 0])]:
+            self.assertEqual(
+                enigma_kernel.encrypt_batch(
+                    message, [packed_circuit], [positions], [notches]
+                ),
+                enigma_kernel.encrypt_batch(
+                    message, [packed_circuit], [wrapped], [notches]
+                ),
+            )
+
+    def test_crack_matches_python_implementation(self):
+        """Test that batch decryption matches the pure Python circuit"""
+        ciphertext = "ASDKJWIOASJDLKJLKJKKKJASLKDJIWKASJD"
+        candidates = [
+            EnigmaMachineConfig(
+                working_rotor_indices=[4, 2, 1], rotors_init_position=[p0, 1, 15]
+            )
+            for p0 in range(26)
+        ]
+        scores = EnigmaMachine.crack(ciphertext, candidates, lambda text: text)
+
+        with mock.patch.object(
+            enigma_kernel, "encrypt_kernel", None
+        ), mock.patch.object(enigma_kernel, "encrypt_batch_kernel", None):
+            self.assertEqual(
+                EnigmaMachine.crack(ciphertext, candidates, lambda text: text),
+                scores,
+            )
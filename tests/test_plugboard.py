@@ -23,10 +23,33 @@ class TestPlugboard(unittest.TestCase):
         self.assertEqual(pb(4), 5)  # E -> F
         self.assertEqual(pb(5), 4)  # F -> E
 
+    def test_character_input(self):
+        """Test passing characters instead of indices"""
+        pb = Plugboard("AB CD EF")
+        self.assertEqual(pb("A"), 1)  # A -> B
+        self.assertEqual(pb("d"), 2)  # D -> C
+        self.assertEqual(pb("Z"), 25)  # Z -> Z
+        with self.assertRaises(ValueError):
+            pb("1")
+
+    def test_apply_many(self):
+        """Test passing many indices at once"""
+        pb = Plugboard("AB CD EF")
+        self.assertEqual(pb.apply_many(bytes([0, 1, 2, 3, 4, 5, 6])), b"\1\0\3\2\5\4\6")
+        self.assertEqual(pb.apply_many(b""), b"")
+
+    def test_translate(self):
+        """Test passing a whole text"""
+        pb = Plugboard("AB CD EF")
+        self.assertEqual(pb.translate(b"ABCDEFGZ"), b"BADCFEGZ")
+        self.assertEqual(pb.translate(b"ab, CD!"), b"ab, DC!")
+        pb.reset_plugboard()
+        self.assertEqual(pb.translate(b"ABCDEF"), b"ABCDEF")
+
     def test_empty_connections(self):
         """Test with no connections"""
         pb = Plugboard("")
-        self.assertEqual(pb.mapping, list(range(26)))
+        self.assertEqual(pb.mapping, bytes(range(26)))
 
     def test_invalid_pair_length(self):
         """Test invalid pair length"""
@@ -45,6 +68,10 @@ class TestPlugboard(unittest.TestCase):
         with self.assertRaises(ValueError) as context:
             Plugboard("A1")
         self.assertIn("Invalid characters in pair", str(context.exception))
+        for pair in ["éà", "11"]:
+            with self.assertRaises(ValueError) as context:
+                Plugboard(pair)
+            self.assertIn("Invalid characters in pair", str(context.exception))
 
     def test_repeated_character_different_pairs(self):
         """Test repeated character in different pairs"""
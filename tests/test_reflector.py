@@ -1,6 +1,8 @@
 import unittest
 from src.reflector import ReflectorConfig, Reflector
 
+_A = ord("A")
+
 
 class TestReflector(unittest.TestCase):
     def setUp(self):
@@ -9,37 +11,27 @@ class TestReflector(unittest.TestCase):
         self.reflector = Reflector(self.config)
 
     def test_reflect(self):
-        self.assertEqual(
-            self.reflector.reflect(ord("T") - ord("A")), ord("A") - ord("A")
-        )
-        self.assertEqual(
-            self.reflector.reflect(ord("B") - ord("A")), ord("G") - ord("A")
-        )
-        self.assertEqual(
-            self.reflector.reflect(ord("H") - ord("A")), ord("N") - ord("A")
-        )
-        self.assertEqual(
-            self.reflector.reflect(ord("D") - ord("A")), ord("Z") - ord("A")
-        )
-        self.assertEqual(
-            self.reflector.reflect(ord("Z") - ord("A")), ord("D") - ord("A")
-        )
-        self.assertEqual(
-            self.reflector.reflect(ord("C") - ord("A")), ord("J") - ord("A")
-        )
-        self.assertEqual(
-            self.reflector.reflect(ord("X") - ord("A")), ord("O") - ord("A")
-        )
-        self.assertEqual(
-            self.reflector.reflect(ord("F") - ord("A")), ord("V") - ord("A")
-        )
+        self.assertEqual(self.reflector.reflect(ord("T") - _A), 0)
+        self.assertEqual(self.reflector.reflect(ord("B") - _A), ord("G") - _A)
+        self.assertEqual(self.reflector.reflect(ord("H") - _A), ord("N") - _A)
+        self.assertEqual(self.reflector.reflect(ord("D") - _A), ord("Z") - _A)
+        self.assertEqual(self.reflector.reflect(ord("Z") - _A), ord("D") - _A)
+        self.assertEqual(self.reflector.reflect(ord("C") - _A), ord("J") - _A)
+        self.assertEqual(self.reflector.reflect(ord("X") - _A), ord("O") - _A)
+        self.assertEqual(self.reflector.reflect(ord("F") - _A), ord("V") - _A)
 
     def test_call(self):
-        self.assertEqual(self.reflector(ord("T") - ord("A")), ord("A") - ord("A"))
-        self.assertEqual(self.reflector(ord("B") - ord("A")), ord("G") - ord("A"))
-        self.assertEqual(self.reflector(ord("H") - ord("A")), ord("N") - ord("A"))
-        self.assertEqual(self.reflector(ord("D") - ord("A")), ord("Z") - ord("A"))
-        self.assertEqual(self.reflector(ord("Z") - ord("A")), ord("D") - ord("A"))
-        self.assertEqual(self.reflector(ord("C") - ord("A")), ord("J") - ord("A"))
-        self.assertEqual(self.reflector(ord("X") - ord("A")), ord("O") - ord("A"))
-        self.assertEqual(self.reflector(ord("F") - ord("A")), ord("V") - ord("A"))
+        self.assertEqual(self.reflector(ord("T") - _A), 0)
+        self.assertEqual(self.reflector(ord("B") - _A), ord("G") - _A)
+        self.assertEqual(self.reflector(ord("H") - _A), ord("N") - _A)
+        self.assertEqual(self.reflector(ord("D") - _A), ord("Z") - _A)
+        self.assertEqual(self.reflector(ord("Z") - _A), ord("D") - _A)
+        self.assertEqual(self.reflector(ord("C") - _A), ord("J") - _A)
+        self.assertEqual(self.reflector(ord("X") - _A), ord("O") - _A)
+        self.assertEqual(self.reflector(ord("F") - _A), ord("V") - _A)
+
+    def test_invalid_wiring(self):
+        with self.assertRaises(ValueError):
+            Reflector(ReflectorConfig(wiring="TGJZKVBNLCEIPHXMRQYAWFUOSA"))
+        with self.assertRaises(ValueError):
+            Reflector(ReflectorConfig(wiring="tgjzkvbnlceiphxmrqyawfuosd"))
@@ -1,6 +1,8 @@
 import unittest
 from src.rotor import Rotor, RotorConfig
 
+_A = ord("A")
+
 
 class TestRotor(unittest.TestCase):
     def setUp(self):
@@ -12,36 +14,79 @@ class TestRotor(unittest.TestCase):
     def test_rotate(self):
         """Test rotor rotation."""
         self.rotor = Rotor(self.config, init_position=0)
-        for i in range(1, 30):
-            self.rotor.rotate()
-            self.assertEqual(self.rotor._position, i % 26)
+        positions = [self.rotor.rotate()._position for _ in range(29)]
+        self.assertEqual(positions, [i % 26 for i in range(1, 30)])
 
     def test_forward(self):
         """Test forward mapping."""
         self.rotor = Rotor(self.config, init_position=0)
-        self.assertEqual(self.rotor.forward(0), (ord("E") - ord("A")))
+        self.assertEqual(self.rotor.forward(0), (ord("E") - _A))
         self.rotor.rotate()
-        self.assertEqual(self.rotor.forward(0), (ord("K") - ord("A")) - 1)
+        self.assertEqual(self.rotor.forward(0), (ord("K") - _A) - 1)
         self.rotor.rotate()
-        self.assertEqual(self.rotor.forward(0), (ord("M") - ord("A")) - 2)
+        self.assertEqual(self.rotor.forward(0), (ord("M") - _A) - 2)
 
     def test_backward(self):
         """Test backward mapping."""
         self.rotor = Rotor(self.config, init_position=0)
-        self.assertEqual(self.rotor.backward(ord("E") - ord("A")), 0)
-        self.assertEqual(self.rotor.backward(ord("L") - ord("A")), 4)
+        self.assertEqual(self.rotor.backward(ord("E") - _A), 0)
+        self.assertEqual(self.rotor.backward(ord("L") - _A), 4)
         self.rotor.rotate()
-        self.assertEqual(self.rotor.backward(ord("E") - ord("A")), 2)
-        self.assertEqual(self.rotor.backward(ord("F") - ord("A")), 4)
+        self.assertEqual(self.rotor.backward(ord("E") - _A), 2)
+        self.assertEqual(self.rotor.backward(ord("F") - _A), 4)
+
+    def test_forward_many(self):
+        """Test batched forward mapping against the scalar one."""
+        self.rotor = Rotor(self.config, init_position=0)
+        self.assertEqual(
+            self.rotor.forward_many(bytes([0, 0, 0])), bytes([ord("E") - _A] * 3)
+        )
+        for position in range(26):
+            self.rotor.set_position(position)
+            self.assertEqual(
+                list(self.rotor.forward_many(bytes(range(26)))),
+                [self.rotor.forward(i) for i in range(26)],
+            )
+
+    def test_backward_many(self):
+        """Test batched backward mapping against the scalar one."""
+        self.rotor = Rotor(self.config, init_position=1)
+        self.assertEqual(
+            self.rotor.backward_many(bytes([ord("E") - _A, ord("F") - _A])),
+            bytes([2, 4]),
+        )
+        for position in range(26):
+            self.rotor.set_position(position)
+            self.assertEqual(
+                list(self.rotor.backward_many(bytes(range(26)))),
+                [self.rotor.backward(i) for i in range(26)],
+            )
+
+    def test_backward_inverts_forward(self):
+        """Test that backward mapping undoes forward mapping at every position."""
+        self.rotor = Rotor(self.config, init_position=0)
+        for position in range(26):
+            self.rotor.set_position(position)
+            for i in range(26):
+                self.assertEqual(self.rotor.backward(self.rotor.forward(i)), i)
+
+    def test_config_mappings_shared(self):
+        """Test that rotors built from one config share its mappings."""
+        rotor_a = Rotor(self.config)
+        rotor_b = Rotor(self.config)
+        self.assertIs(rotor_a.forward_mapping, rotor_b.forward_mapping)
+        self.assertIs(rotor_a.backward_mapping, self.config.backward_mapping)
+        with self.assertRaises(AttributeError):
+            self.config.wiring = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
     def test_call(self):
         """Test __call__ method."""
         self.rotor = Rotor(self.config, init_position=0)
-        self.assertEqual(self.rotor(0), (ord("E") - ord("A")))
+        self.assertEqual(self.rotor(0), (ord("E") - _A))
         self.rotor.rotate()
-        self.assertEqual(self.rotor(0), (ord("K") - ord("A")) - 1)
+        self.assertEqual(self.rotor(0), (ord("K") - _A) - 1)
         self.rotor.rotate()
-        self.assertEqual(self.rotor(0), (ord("M") - ord("A")) - 2)
+        self.assertEqual(self.rotor(0), (ord("M") - _A) - 2)
 
     def test_set_position(self):
         """Test setting rotor position."""